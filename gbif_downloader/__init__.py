@@ -26,9 +26,13 @@ Example Python usage:
 __version__ = "2.0.0"
 __author__ = "Francesco Mensa"
 
-from gbif_downloader.api import GBIFClient, GBIFError, TaxonNotFoundError
-from gbif_downloader.filters import FilterConfig, RecordFilter
-from gbif_downloader.config import Config
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gbif_downloader.api import GBIFClient, GBIFError, TaxonNotFoundError
+    from gbif_downloader.config import Config
+    from gbif_downloader.filters import FilterConfig, RecordFilter
 
 __all__ = [
     "GBIFClient",
@@ -39,3 +43,29 @@ __all__ = [
     "Config",
     "__version__",
 ]
+
+# Public name -> defining module. Resolved lazily (PEP 562) so that
+# `import gbif_downloader` stays cheap for callers that only need
+# __version__, e.g. `gbif-download --version`.
+_LAZY_IMPORTS = {
+    "GBIFClient": "gbif_downloader.api",
+    "GBIFError": "gbif_downloader.api",
+    "TaxonNotFoundError": "gbif_downloader.api",
+    "FilterConfig": "gbif_downloader.filters",
+    "RecordFilter": "gbif_downloader.filters",
+    "Config": "gbif_downloader.config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes on first attribute access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    attr = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,15 +5,25 @@ This module provides a clean interface to the GBIF occurrence API with:
 - Connection pooling and session management
 - Exponential backoff retry logic
 - Proper rate limit handling
-- Cursor-based pagination to avoid offset limits
+- Year/month partitioned pagination to stay under GBIF's offset limit
 - Taxon validation to prevent downloading wrong data
 """
 
 from __future__ import annotations
 
 import logging
+import queue
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from operator import attrgetter
+from pathlib import Path
 from typing import Any, Generator, Callable
 from urllib.parse import urljoin
 
@@ -23,6 +33,14 @@ from urllib3.util.retry import Retry
 
 from gbif_downloader.utils import retry_with_backoff, get_logger
 
+# Try to import orjson for faster response decoding
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # GBIF API base URL
 GBIF_API_BASE = "https://api.gbif.org/v1/"
 
@@ -34,6 +52,83 @@ OCCURRENCE_SEARCH_ENDPOINT = "occurrence/search"
 DEFAULT_TIMEOUT = (10, 30)  # (connect, read) in seconds
 DEFAULT_PAGE_SIZE = 300
 MAX_OFFSET = 100000  # GBIF's hard limit
+DEFAULT_MAX_WORKERS = 4  # Years fetched concurrently by iter_occurrences_by_year
+MAX_RATE_LIMIT_WAIT = 60  # Longest Retry-After we honor, in seconds
+TAXON_CACHE_EXPIRY = timedelta(days=7)  # On-disk taxon match lifetime
+PREFETCH_PAGES = 4  # Pages buffered per year ahead of the consumer
+STOP_POLL_INTERVAL = 0.25  # How often blocked workers check for a stop, in seconds
+
+# Export column name -> OccurrenceRecord attribute, in output order
+EXPORT_FIELDS = (
+    ("Year", "year"),
+    ("Date", "event_date"),
+    ("Latitude", "latitude"),
+    ("Longitude", "longitude"),
+    ("Uncertainty (m)", "coordinate_uncertainty"),
+    ("Elevation (m)", "elevation"),
+    ("Locality", "locality"),
+    ("Genus", "genus"),
+    ("Species", "species"),
+    ("Scientific Name", "scientific_name"),
+    ("Institution", "institution_code"),
+    ("Catalog No", "catalog_number"),
+    ("Recorded By", "recorded_by"),
+    ("Country", "country"),
+    ("State/Province", "state_province"),
+    ("Link", "gbif_url"),
+)
+EXPORT_COLUMNS = tuple(column for column, _ in EXPORT_FIELDS)
+_get_export_values = attrgetter(*(attr for _, attr in EXPORT_FIELDS))
+
+
+def _retry_after_seconds(response: requests.Response, default: float) -> float:
+    """
+    Read the Retry-After header of a response, in seconds.
+
+    Accepts both forms allowed by HTTP: a number of seconds or an HTTP
+    date. Falls back to default when the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return default
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _sleep(seconds: float, stop_check: Callable[[], bool] | None = None) -> bool:
+    """
+    Sleep for the given time, waking early once stop_check returns True.
+
+    Returns:
+        False if the sleep was cut short by stop_check, True otherwise
+    """
+    if stop_check is None:
+        time.sleep(seconds)
+        return True
+
+    deadline = time.monotonic() + seconds
+    while not stop_check():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True
+        time.sleep(min(remaining, STOP_POLL_INTERVAL))
+    return False
+
+
+def _intern(value: Any) -> Any:
+    """Intern a repeated string so every record shares a single copy."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 class GBIFError(Exception):
@@ -111,9 +206,32 @@ class OccurrenceRecord:
     """
     A single occurrence record from GBIF.
 
-    Stores the key fields needed for biodiversity research.
+    Stores the key fields needed for biodiversity research. Downloads can
+    hold hundreds of thousands of these, so the class uses __slots__
+    (declared by hand, as dataclass(slots=True) needs Python 3.10).
     """
 
+    __slots__ = (
+        "key",
+        "year",
+        "event_date",
+        "latitude",
+        "longitude",
+        "coordinate_uncertainty",
+        "elevation",
+        "locality",
+        "genus",
+        "species",
+        "scientific_name",
+        "specific_epithet",
+        "institution_code",
+        "catalog_number",
+        "recorded_by",
+        "country",
+        "state_province",
+        "basis_of_record",
+    )
+
     key: int
     year: int | None
     event_date: str | None
@@ -135,7 +253,13 @@ class OccurrenceRecord:
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> OccurrenceRecord:
-        """Create OccurrenceRecord from GBIF API response."""
+        """
+        Create OccurrenceRecord from GBIF API response.
+
+        Low-cardinality text fields (taxonomy, institution, country, ...)
+        are interned: a download of one genus repeats the same handful of
+        values across every record, so they share one string each.
+        """
         return cls(
             key=data.get("key", 0),
             year=data.get("year"),
@@ -145,16 +269,16 @@ class OccurrenceRecord:
             coordinate_uncertainty=data.get("coordinateUncertaintyInMeters"),
             elevation=data.get("elevation"),
             locality=data.get("locality"),
-            genus=data.get("genus"),
-            species=data.get("species"),
-            scientific_name=data.get("scientificName"),
-            specific_epithet=data.get("specificEpithet"),
-            institution_code=data.get("institutionCode"),
+            genus=_intern(data.get("genus")),
+            species=_intern(data.get("species")),
+            scientific_name=_intern(data.get("scientificName")),
+            specific_epithet=_intern(data.get("specificEpithet")),
+            institution_code=_intern(data.get("institutionCode")),
             catalog_number=data.get("catalogNumber"),
             recorded_by=data.get("recordedBy"),
-            country=data.get("country"),
-            state_province=data.get("stateProvince"),
-            basis_of_record=data.get("basisOfRecord"),
+            country=_intern(data.get("country")),
+            state_province=_intern(data.get("stateProvince")),
+            basis_of_record=_intern(data.get("basisOfRecord")),
         )
 
     @property
@@ -162,26 +286,13 @@ class OccurrenceRecord:
         """Get the URL to view this record on GBIF."""
         return f"https://www.gbif.org/occurrence/{self.key}"
 
+    def to_row(self) -> tuple[Any, ...]:
+        """Get the export values as a tuple, in EXPORT_COLUMNS order."""
+        return _get_export_values(self)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for export."""
-        return {
-            "Year": self.year,
-            "Date": self.event_date,
-            "Latitude": self.latitude,
-            "Longitude": self.longitude,
-            "Uncertainty (m)": self.coordinate_uncertainty,
-            "Elevation (m)": self.elevation,
-            "Locality": self.locality,
-            "Genus": self.genus,
-            "Species": self.species,
-            "Scientific Name": self.scientific_name,
-            "Institution": self.institution_code,
-            "Catalog No": self.catalog_number,
-            "Recorded By": self.recorded_by,
-            "Country": self.country,
-            "State/Province": self.state_province,
-            "Link": self.gbif_url,
-        }
+        return dict(zip(EXPORT_COLUMNS, _get_export_values(self)))
 
 
 class GBIFClient:
@@ -202,6 +313,8 @@ class GBIFClient:
         timeout: tuple[int, int] = DEFAULT_TIMEOUT,
         max_retries: int = 3,
         page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_path: str | Path | None = None,
     ):
         """
         Initialize GBIF client.
@@ -210,28 +323,66 @@ class GBIFClient:
             timeout: Request timeout as (connect, read) seconds
             max_retries: Maximum retry attempts for failed requests
             page_size: Number of records per API request (max 300)
+            max_workers: Number of years fetched concurrently
+            cache_path: SQLite file for caching taxon matches across runs
+                (requires requests-cache). Occurrence data is never cached.
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.page_size = min(page_size, 300)  # GBIF max is 300
+        self.max_workers = max(1, max_workers)
+        self.cache_path = cache_path
         self.logger = get_logger()
 
+        # Taxon matches by (name, kingdom, class_name); the backbone does
+        # not change within a session
+        self._taxon_cache: dict[tuple[str, str, str | None], TaxonMatch] = {}
+
         # Create session with retry configuration
         self.session = self._create_session()
 
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry logic."""
-        session = requests.Session()
-
-        # Configure retry strategy
+        if self.cache_path is None:
+            session = requests.Session()
+        else:
+            # Imported here: requests-cache is optional and slow to import
+            try:
+                import requests_cache
+            except ImportError:
+                raise ImportError(
+                    "requests-cache is required for cache_path. "
+                    "Install with: pip install gbif-downloader[cache]"
+                ) from None
+
+            # Only taxon matches are cached; the backbone changes rarely,
+            # while occurrence results must always be fresh
+            session = requests_cache.CachedSession(
+                str(self.cache_path),
+                backend="sqlite",
+                expire_after=requests_cache.DO_NOT_CACHE,
+                urls_expire_after={
+                    urljoin(GBIF_API_BASE, SPECIES_MATCH_ENDPOINT): TAXON_CACHE_EXPIRY,
+                },
+                allowable_methods=("GET",),
+                allowable_codes=(200,),
+            )
+
+        # Configure retry strategy for server errors. Rate limiting (429)
+        # is handled in _make_request, which honors Retry-After with jitter.
         retry_strategy = Retry(
             total=self.max_retries,
             backoff_factor=1.0,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET"],
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One pooled connection per worker thread
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            max_retries=retry_strategy,
+        )
         session.mount("https://", adapter)
         session.mount("http://", adapter)
 
@@ -249,30 +400,55 @@ class GBIFClient:
         self,
         endpoint: str,
         params: dict[str, Any] | None = None,
+        stop_check: Callable[[], bool] | None = None,
     ) -> dict[str, Any]:
         """
         Make a request to the GBIF API.
 
+        Rate-limited requests (429) are retried up to max_retries times,
+        waiting for the server's Retry-After (or an exponential backoff
+        when absent) plus random jitter, so concurrent clients do not all
+        retry at the same moment.
+
         Args:
             endpoint: API endpoint path
             params: Query parameters
+            stop_check: Function that returns True to abandon a rate limit
+                wait early
 
         Returns:
             JSON response as dictionary
 
         Raises:
-            RateLimitError: If rate limited
+            RateLimitError: If still rate limited after all retries, or
+                stopped while waiting
             APIError: For other API errors
         """
         url = urljoin(GBIF_API_BASE, endpoint)
 
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
+            for attempt in range(self.max_retries + 1):
+                response = self.session.get(url, params=params, timeout=self.timeout)
 
-            if response.status_code == 429:
-                raise RateLimitError("GBIF rate limit exceeded. Please wait and retry.")
+                if response.status_code != 429:
+                    break
+
+                if attempt == self.max_retries:
+                    raise RateLimitError(
+                        "GBIF rate limit exceeded. Please wait and retry."
+                    )
+
+                delay = min(
+                    _retry_after_seconds(response, default=2.0 ** attempt),
+                    MAX_RATE_LIMIT_WAIT,
+                ) + random.uniform(0, 1)
+                self.logger.warning(f"Rate limited by GBIF. Retrying in {delay:.1f}s...")
+                if not _sleep(delay, stop_check):
+                    raise RateLimitError("Stopped while waiting for the GBIF rate limit.")
 
             response.raise_for_status()
+            if HAS_ORJSON:
+                return orjson.loads(response.content)
             return response.json()
 
         except requests.exceptions.HTTPError as e:
@@ -283,6 +459,8 @@ class GBIFClient:
             raise APIError(f"Request timeout: {e}")
         except requests.exceptions.RequestException as e:
             raise APIError(f"Request failed: {e}")
+        except ValueError as e:
+            raise APIError(f"Invalid JSON response: {e}") from e
 
     def match_taxon(
         self,
@@ -295,6 +473,9 @@ class GBIFClient:
         """
         Match a taxonomic name against GBIF backbone.
 
+        Matches are cached per client, so repeated lookups of the same name
+        do not hit the API again. Rank validation runs on every call.
+
         Args:
             name: Taxon name to match (e.g., "Nebria", "Nebria germarii")
             rank: Expected rank (GENUS, SPECIES, FAMILY, etc.)
@@ -308,14 +489,19 @@ class GBIFClient:
         Raises:
             TaxonNotFoundError: If taxon not found or doesn't match expected rank
         """
-        params = {"name": name, "kingdom": kingdom}
+        cache_key = (name, kingdom, class_name)
+        match = self._taxon_cache.get(cache_key)
+
+        if match is None:
+            params = {"name": name, "kingdom": kingdom}
 
-        if class_name:
-            params["class"] = class_name
+            if class_name:
+                params["class"] = class_name
 
-        self.logger.debug(f"Matching taxon: {name}")
-        data = self._make_request(SPECIES_MATCH_ENDPOINT, params)
-        match = TaxonMatch.from_api_response(data)
+            self.logger.debug(f"Matching taxon: {name}")
+            data = self._make_request(SPECIES_MATCH_ENDPOINT, params)
+            match = TaxonMatch.from_api_response(data)
+            self._taxon_cache[cache_key] = match
 
         # Validate the match
         if match.match_type == "NONE":
@@ -474,6 +660,12 @@ class GBIFClient:
         Iterate over occurrences year by year to avoid offset limits.
 
         This is the recommended method for large datasets (>100K records).
+        A single facet query first finds which years have records, so empty
+        years cost no requests. Up to max_workers years are fetched
+        concurrently, a few years ahead of the consumer; each year hands
+        over at most PREFETCH_PAGES pages at a time, and records are still
+        yielded in year order. If a year fails part way, the records
+        already fetched for it are kept.
 
         Args:
             taxon_key: GBIF taxon key
@@ -491,81 +683,278 @@ class GBIFClient:
         if year_end is None:
             year_end = datetime.now().year
 
-        # Get total count estimate
-        total_estimate = self.count_occurrences(
-            taxon_key=taxon_key,
-            basis_of_record=basis_of_record,
-            has_coordinate=has_coordinate,
-            country=country,
-        )
-        self.logger.info(f"Estimated total: {total_estimate:,} records")
+        params = {
+            "taxonKey": taxon_key,
+            "hasCoordinate": str(has_coordinate).lower(),
+        }
+
+        if basis_of_record:
+            params["basisOfRecord"] = basis_of_record
+
+        if country:
+            params["country"] = country
+
+        # Only visit years that have records
+        year_counts = self._populated_years(params, year_start, year_end)
+        if year_counts is None:
+            years_to_fetch = list(range(year_start, year_end + 1))
+        else:
+            years_to_fetch = sorted(year_counts)
+            self.logger.info(
+                f"{len(years_to_fetch)} of {year_end - year_start + 1} years "
+                f"have records"
+            )
+
+        # Get total count estimate (only needed to report progress)
+        total_estimate = 0
+        if progress_callback is not None:
+            if year_counts is not None:
+                total_estimate = sum(year_counts.values())
+            else:
+                total_estimate = self.count_occurrences(
+                    taxon_key=taxon_key,
+                    basis_of_record=basis_of_record,
+                    has_coordinate=has_coordinate,
+                    country=country,
+                )
+            self.logger.info(f"Estimated total: {total_estimate:,} records")
 
         count = 0
-        seen_keys: set[int] = set()  # For deduplication
 
-        for year in range(year_start, year_end + 1):
-            # Check if we should stop
-            if stop_check and stop_check():
-                self.logger.info("Download stopped by user")
-                break
+        # Workers only do I/O; stop checks, deduplication and progress stay
+        # on the consuming thread. `abandoned` also stops the workers if the
+        # consumer closes this generator early.
+        abandoned = threading.Event()
+        year_done = object()
 
-            self.logger.debug(f"Processing year {year}")
+        def worker_stop() -> bool:
+            return abandoned.is_set() or bool(stop_check and stop_check())
 
-            params = {
-                "taxonKey": taxon_key,
-                "hasCoordinate": str(has_coordinate).lower(),
-                "year": year,
-                "limit": self.page_size,
-                "offset": 0,
-            }
+        def hand_over(pages: queue.Queue, item: Any) -> bool:
+            # Block while the consumer is behind, but give up once abandoned
+            while not abandoned.is_set():
+                try:
+                    pages.put(item, timeout=STOP_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    pass
+            return False
 
-            if basis_of_record:
-                params["basisOfRecord"] = basis_of_record
+        def fetch_year(year: int, pages: queue.Queue) -> None:
+            self.logger.debug(f"Processing year {year}")
+            try:
+                for page in self._iter_year_pages(params, year, worker_stop):
+                    if not hand_over(pages, page):
+                        return
+            except RateLimitError:
+                # Also raised when a stop cuts a rate limit wait short
+                if not worker_stop():
+                    raise
+            finally:
+                hand_over(pages, year_done)
+
+        years = iter(years_to_fetch)
+        pending: deque[tuple[int, queue.Queue, Future]] = deque()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        def submit_next() -> None:
+            # Start no new years once stopping
+            if worker_stop():
+                return
+            year = next(years, None)
+            if year is not None:
+                pages: queue.Queue = queue.Queue(maxsize=PREFETCH_PAGES)
+                pending.append((year, pages, executor.submit(fetch_year, year, pages)))
 
-            if country:
-                params["country"] = country
+        try:
+            for _ in range(self.max_workers * 2):
+                submit_next()
 
-            while True:
+            while pending:
+                # Check if we should stop
                 if stop_check and stop_check():
+                    self.logger.info("Download stopped by user")
                     break
 
+                year, pages, future = pending.popleft()
+                submit_next()
+
+                # A record belongs to exactly one year, so duplicates (from
+                # results shifting between offset pages) can only occur
+                # within a year; keeping keys per year bounds memory
+                seen_keys: set[int] = set()
+
+                while (page := pages.get()) is not year_done:
+                    for item in page:
+                        record = OccurrenceRecord.from_api_response(item)
+
+                        # Deduplicate
+                        if record.key in seen_keys:
+                            continue
+                        seen_keys.add(record.key)
+
+                        yield record
+                        count += 1
+
+                        if progress_callback:
+                            progress_callback(count, total_estimate, year)
+
                 try:
-                    data = self._make_request(OCCURRENCE_SEARCH_ENDPOINT, params)
-                except APIError as e:
+                    future.result()
+                except (APIError, RateLimitError) as e:
                     self.logger.warning(f"Error fetching year {year}: {e}")
-                    break
+        finally:
+            abandoned.set()
+            for _, _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
 
-                results = data.get("results", [])
-                if not results:
-                    break
+        self.logger.info(f"Downloaded {count:,} unique records")
 
-                for item in results:
-                    record = OccurrenceRecord.from_api_response(item)
+    def _populated_years(
+        self,
+        params: dict[str, Any],
+        year_start: int,
+        year_end: int,
+    ) -> dict[int, int] | None:
+        """
+        Find the years in a range that have records, with one facet query.
 
-                    # Deduplicate
-                    if record.key in seen_keys:
-                        continue
-                    seen_keys.add(record.key)
+        Args:
+            params: Base query parameters (without year/limit/offset)
+            year_start: First year of the range
+            year_end: Last year of the range
 
-                    yield record
-                    count += 1
+        Returns:
+            Record count per non-empty year, or None if the facet query
+            failed (callers should then try every year in the range)
+        """
+        facet_params = {
+            **params,
+            "year": f"{year_start},{year_end}",
+            "facet": "year",
+            "facetLimit": year_end - year_start + 1,
+            "limit": 0,
+        }
 
-                    if progress_callback:
-                        progress_callback(count, total_estimate, year)
+        try:
+            data = self._make_request(OCCURRENCE_SEARCH_ENDPOINT, facet_params)
+        except (APIError, RateLimitError) as e:
+            self.logger.warning(f"Year facet query failed, trying every year: {e}")
+            return None
 
-                if data.get("endOfRecords", False) or len(results) < self.page_size:
-                    break
+        if data.get("count") == 0:
+            return {}
 
-                params["offset"] += self.page_size
+        for facet in data.get("facets") or []:
+            if str(facet.get("field", "")).upper() == "YEAR":
+                return {
+                    int(entry["name"]): entry["count"]
+                    for entry in facet.get("counts", [])
+                }
 
-                # Safety check for single-year offset limit
-                if params["offset"] >= MAX_OFFSET:
-                    self.logger.warning(
-                        f"Year {year} has >100K records. Some may be missed."
-                    )
-                    break
+        return None
 
-        self.logger.info(f"Downloaded {count:,} unique records")
+    def _iter_year_pages(
+        self,
+        params: dict[str, Any],
+        year: int,
+        stop_check: Callable[[], bool] | None = None,
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """
+        Iterate over pages of raw results for one year.
+
+        GBIF search has no sort order or cursor, so offset paging cannot go
+        past MAX_OFFSET. Years with more records than that are split into
+        one query per month, each of which stays under the limit. Records
+        of such a year that have no month cannot be reached this way; the
+        shortfall is logged as a warning.
+
+        Args:
+            params: Base query parameters (without year/limit/offset)
+            year: Year to fetch
+            stop_check: Function that returns True to stop iteration
+
+        Yields:
+            Lists of raw occurrence result dictionaries
+        """
+        year_params = {**params, "year": year}
+        first_page = self._make_request(
+            OCCURRENCE_SEARCH_ENDPOINT,
+            {**year_params, "limit": self.page_size, "offset": 0},
+            stop_check=stop_check,
+        )
+
+        total = first_page.get("count", 0)
+        if total <= MAX_OFFSET:
+            yield from self._iter_pages(year_params, stop_check, first_page)
+            return
+
+        self.logger.info(f"Year {year} has {total:,} records; splitting by month")
+        fetched = 0
+        for month in range(1, 13):
+            for page in self._iter_pages({**year_params, "month": month}, stop_check):
+                fetched += len(page)
+                yield page
+
+        if fetched < total and not (stop_check and stop_check()):
+            self.logger.warning(
+                f"Year {year}: {total - fetched:,} of {total:,} records were not "
+                f"returned by the monthly queries (e.g. records without a month)"
+            )
+
+    def _iter_pages(
+        self,
+        params: dict[str, Any],
+        stop_check: Callable[[], bool] | None = None,
+        first_page: dict[str, Any] | None = None,
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """
+        Page through one search query by offset, up to MAX_OFFSET.
+
+        Args:
+            params: Query parameters (without limit/offset)
+            stop_check: Function that returns True to stop iteration
+            first_page: Already fetched response for offset 0, if any
+
+        Yields:
+            Non-empty lists of raw occurrence result dictionaries
+        """
+        params = {**params, "limit": self.page_size, "offset": 0}
+        data = first_page
+
+        while True:
+            if stop_check and stop_check():
+                return
+
+            if data is None:
+                data = self._make_request(
+                    OCCURRENCE_SEARCH_ENDPOINT, params, stop_check=stop_check
+                )
+
+            results = data.get("results", [])
+            if results:
+                yield results
+
+            if (
+                not results
+                or data.get("endOfRecords", False)
+                or len(results) < self.page_size
+            ):
+                return
+
+            params["offset"] += self.page_size
+            data = None
+
+            # Safety check for the offset limit
+            if params["offset"] >= MAX_OFFSET:
+                period = params.get("year", "Query")
+                if "month" in params:
+                    period = f"{period}-{params['month']:02d}"
+                self.logger.warning(
+                    f"{period} has >{MAX_OFFSET:,} records. Some may be missed."
+                )
+                return
 
     def close(self) -> None:
         """Close the session and release resources."""
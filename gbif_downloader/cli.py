@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 from rich.console import Console
@@ -25,12 +26,14 @@ from rich.progress import (
 from rich.table import Table
 
 from gbif_downloader import __version__
-from gbif_downloader.api import GBIFClient, GBIFError, TaxonNotFoundError
-from gbif_downloader.filters import FilterConfig, RecordFilter, format_filter_stats
-from gbif_downloader.config import Config, create_example_config, list_presets
-from gbif_downloader.exporters import get_exporter
+from gbif_downloader.exporters import get_exporter, get_extension
 from gbif_downloader.utils import setup_logging, sanitize_filename
 
+# The API client (requests), config (yaml) and filters are imported by the
+# commands that use them, so --help and --version start quickly
+if TYPE_CHECKING:
+    from gbif_downloader.filters import FilterConfig
+
 console = Console()
 
 
@@ -109,9 +112,14 @@ def print_banner():
 @click.option(
     "--config",
     "config_file",
-    type=click.Path(exists=True),
+    type=click.Path(),
     help="Load settings from YAML config file",
 )
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    help="Reuse taxon matches from earlier runs (needs requests-cache; default: no)",
+)
 @click.option(
     "--verbose", "-v",
     is_flag=True,
@@ -138,6 +146,7 @@ def main(
     output_format,
     output,
     config_file,
+    cache,
     verbose,
     version,
 ):
@@ -172,6 +181,9 @@ def main(
             click.echo(ctx.get_help())
             sys.exit(0)
 
+    from gbif_downloader.config import Config
+    from gbif_downloader.filters import FilterConfig
+
     # Setup logging
     setup_logging(verbose=verbose)
 
@@ -216,11 +228,10 @@ def main(
     if not output:
         taxon_name = filter_config.genus or filter_config.family
         safe_name = sanitize_filename(taxon_name)
-        ext = {"excel": ".xlsx", "csv": ".csv", "geojson": ".geojson"}[output_format]
-        output = f"{safe_name}_GBIF{ext}"
+        output = f"{safe_name}_GBIF{get_extension(output_format)}"
 
     # Run the download
-    run_download(filter_config, output_format, output, verbose)
+    run_download(filter_config, output_format, output, verbose, cache)
 
 
 def run_download(
@@ -228,6 +239,7 @@ def run_download(
     output_format: str,
     output_path: str,
     verbose: bool = False,
+    cache: bool = False,
 ):
     """
     Run the download process.
@@ -237,12 +249,21 @@ def run_download(
         output_format: Output format
         output_path: Output file path
         verbose: Enable verbose output
+        cache: Reuse taxon matches cached on disk by earlier runs
     """
+    from gbif_downloader.api import GBIFClient, GBIFError, TaxonNotFoundError
+    from gbif_downloader.config import get_taxon_cache_path
+    from gbif_downloader.filters import RecordFilter
+
     # Show configuration
     show_config(filter_config)
 
     # Initialize client and filter
-    client = GBIFClient()
+    try:
+        client = GBIFClient(cache_path=get_taxon_cache_path() if cache else None)
+    except ImportError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
     record_filter = RecordFilter(filter_config)
 
     try:
@@ -274,11 +295,7 @@ def run_download(
 
         # Download with progress
         filtered_records = []
-        stats = {
-            "total": 0,
-            "kept": 0,
-            "filtered": 0,
-        }
+        downloaded = 0
 
         with Progress(
             SpinnerColumn(),
@@ -306,21 +323,17 @@ def run_download(
                 year_end=filter_config.year_end,
                 progress_callback=progress_callback,
             ):
-                stats["total"] += 1
-                result = record_filter.apply(record)
-
-                if result.keep:
+                downloaded += 1
+                if record_filter.apply(record).keep:
                     filtered_records.append(record)
-                    stats["kept"] += 1
-                else:
-                    stats["filtered"] += 1
 
         console.print()
 
-        # Show results
-        console.print(f"[green]Records downloaded:[/green] {stats['total']:,}")
-        console.print(f"[green]Records kept after filtering:[/green] {stats['kept']:,}")
-        console.print(f"[dim]Records filtered out:[/dim] {stats['filtered']:,}\n")
+        # Show results (kept/filtered are derived, not counted per record)
+        kept = len(filtered_records)
+        console.print(f"[green]Records downloaded:[/green] {downloaded:,}")
+        console.print(f"[green]Records kept after filtering:[/green] {kept:,}")
+        console.print(f"[dim]Records filtered out:[/dim] {downloaded - kept:,}\n")
 
         if not filtered_records:
             console.print("[yellow]No records passed the filters.[/yellow]")
@@ -376,6 +389,8 @@ def show_config(config: FilterConfig):
 @click.argument("path", type=click.Path(), default="example_config.yaml")
 def init(path):
     """Create an example configuration file."""
+    from gbif_downloader.config import create_example_config
+
     print_banner()
 
     output_path = create_example_config(path)
@@ -386,6 +401,8 @@ def init(path):
 @main.command()
 def presets():
     """List available preset configurations."""
+    from gbif_downloader.config import list_presets
+
     print_banner()
 
     preset_list = list_presets()
@@ -14,6 +14,14 @@ import yaml
 from gbif_downloader.filters import FilterConfig
 from gbif_downloader.utils import get_logger
 
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python
+try:
+    from yaml import CSafeDumper as YAMLDumper
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeDumper as YAMLDumper
+    from yaml import SafeLoader as YAMLLoader
+
 
 class Config:
     """
@@ -70,11 +78,12 @@ class Config:
         """
         path = Path(path)
 
-        if not path.exists():
+        # Single stat; also rejects directories before open() is attempted
+        if not path.is_file():
             raise FileNotFoundError(f"Config file not found: {path}")
 
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAMLLoader)
 
         if not data:
             raise ValueError(f"Empty config file: {path}")
@@ -119,7 +128,13 @@ class Config:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                data,
+                f,
+                Dumper=YAMLDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
 
         self.logger.info(f"Configuration saved to: {path}")
 
@@ -170,6 +185,16 @@ def get_config_dir() -> Path:
     return DEFAULT_CONFIG_DIR
 
 
+def get_taxon_cache_path() -> Path:
+    """
+    Get the path of the on-disk taxon match cache.
+
+    Returns:
+        Path to the SQLite cache file in the config directory
+    """
+    return get_config_dir() / "taxon_cache.sqlite"
+
+
 def list_presets() -> list[str]:
     """
     List available preset configurations.
@@ -5,19 +5,82 @@ This package provides exporters for various file formats:
 - Excel (.xlsx) with conditional formatting
 - CSV (.csv) for universal compatibility
 - GeoJSON (.geojson) for GIS applications
+
+Exporter classes are imported lazily on first access, so importing this
+package (e.g. from the CLI) does not pull in openpyxl until an export
+actually runs.
 """
 
-from gbif_downloader.exporters.excel import ExcelExporter
-from gbif_downloader.exporters.csv import CSVExporter
-from gbif_downloader.exporters.geojson import GeoJSONExporter
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Static imports for type checkers, and so bundlers such as PyInstaller
+    # still discover the lazily imported exporter modules
+    from gbif_downloader.exporters.csv import CSVExporter
+    from gbif_downloader.exporters.excel import ExcelExporter
+    from gbif_downloader.exporters.geojson import GeoJSONExporter
+
+__all__ = [
+    "ExcelExporter",
+    "CSVExporter",
+    "GeoJSONExporter",
+    "get_exporter",
+    "get_extension",
+]
+
+# Exporter class name -> module that defines it
+_EXPORTER_MODULES = {
+    "ExcelExporter": "gbif_downloader.exporters.excel",
+    "CSVExporter": "gbif_downloader.exporters.csv",
+    "GeoJSONExporter": "gbif_downloader.exporters.geojson",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exporter classes on first attribute access (PEP 562)."""
+    if name not in _EXPORTER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_EXPORTER_MODULES[name])
+    attr = getattr(module, name)
+    globals()[name] = attr  # Cache so __getattr__ is only hit once
+    return attr
 
-__all__ = ["ExcelExporter", "CSVExporter", "GeoJSONExporter"]
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+# Format name -> (exporter class name, default file extension)
+_FORMATS = {
+    "excel": ("ExcelExporter", ".xlsx"),
+    "xlsx": ("ExcelExporter", ".xlsx"),
+    "csv": ("CSVExporter", ".csv"),
+    "geojson": ("GeoJSONExporter", ".geojson"),
+    "json": ("GeoJSONExporter", ".geojson"),
+}
+
+
+def _lookup_format(format_name: str) -> tuple[str, str]:
+    """Resolve a format name to its table entry, validating it once."""
+    try:
+        return _FORMATS[format_name.lower()]
+    except KeyError:
+        supported = ", ".join(sorted(_FORMATS))
+        raise ValueError(
+            f"Unsupported format: {format_name}. Supported formats: {supported}"
+        ) from None
 
 
 def get_exporter(format_name: str):
     """
     Get the appropriate exporter for a format name.
 
+    Only the module for the requested format is imported.
+
     Args:
         format_name: Format name (excel, csv, geojson)
 
@@ -27,19 +90,22 @@ def get_exporter(format_name: str):
     Raises:
         ValueError: If format is not supported
     """
-    exporters = {
-        "excel": ExcelExporter,
-        "xlsx": ExcelExporter,
-        "csv": CSVExporter,
-        "geojson": GeoJSONExporter,
-        "json": GeoJSONExporter,
-    }
-
-    format_lower = format_name.lower()
-    if format_lower not in exporters:
-        supported = ", ".join(sorted(set(exporters.keys())))
-        raise ValueError(
-            f"Unsupported format: {format_name}. Supported formats: {supported}"
-        )
+    class_name, _ = _lookup_format(format_name)
+    return __getattr__(class_name)
+
+
+def get_extension(format_name: str) -> str:
+    """
+    Get the default file extension for a format name.
+
+    Args:
+        format_name: Format name (excel, csv, geojson)
+
+    Returns:
+        Extension including the leading dot (e.g., ".xlsx")
 
-    return exporters[format_lower]
+    Raises:
+        ValueError: If format is not supported
+    """
+    _, extension = _lookup_format(format_name)
+    return extension
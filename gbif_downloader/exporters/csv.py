@@ -8,11 +8,11 @@ software or data processing tool.
 from __future__ import annotations
 
 import csv
+import os
+from collections.abc import Iterable
 from pathlib import Path
 
-import pandas as pd
-
-from gbif_downloader.api import OccurrenceRecord
+from gbif_downloader.api import EXPORT_COLUMNS, OccurrenceRecord
 from gbif_downloader.utils import get_logger
 
 
@@ -58,33 +58,14 @@ class CSVExporter:
         Returns:
             Path to the created file
         """
-        output_path = Path(output_path)
-
-        # Ensure .csv extension
-        if output_path.suffix.lower() != ".csv":
-            output_path = output_path.with_suffix(".csv")
-
         self.logger.info(f"Exporting {len(records):,} records to CSV...")
 
-        # Convert records to dictionaries
-        data = [record.to_dict() for record in records]
-        df = pd.DataFrame(data)
-
-        # Export to CSV
-        df.to_csv(
-            output_path,
-            index=False,
-            encoding=self.encoding,
-            sep=self.delimiter,
-            quoting=csv.QUOTE_NONNUMERIC,
-        )
-
-        self.logger.info(f"CSV file saved: {output_path}")
-        return output_path
+        # Rows are written one at a time; no intermediate DataFrame is built
+        return self.export_streaming(records, output_path)
 
     def export_streaming(
         self,
-        records_iter,
+        records_iter: Iterable[OccurrenceRecord],
         output_path: str | Path,
         fieldnames: list[str] | None = None,
     ) -> Path:
@@ -92,12 +73,13 @@ class CSVExporter:
         Export records in streaming mode (for large datasets).
 
         This method writes records one at a time, reducing memory usage
-        for very large datasets.
+        for very large datasets. It accepts any iterable, so records can
+        be piped straight from the download/filter loop.
 
         Args:
-            records_iter: Iterator of OccurrenceRecord objects
+            records_iter: Iterable of OccurrenceRecord objects
             output_path: Output file path
-            fieldnames: Column names (auto-detected from first record if None)
+            fieldnames: Column names to write (all export columns if None)
 
         Returns:
             Path to the created file
@@ -109,26 +91,34 @@ class CSVExporter:
 
         self.logger.info("Starting streaming CSV export...")
 
+        if fieldnames is None:
+            fieldnames = list(EXPORT_COLUMNS)
+            rows = (record.to_row() for record in records_iter)
+        else:
+            # Select the requested columns by position
+            indices = [EXPORT_COLUMNS.index(name) for name in fieldnames]
+            rows = (
+                [values[i] for i in indices]
+                for values in (record.to_row() for record in records_iter)
+            )
+
         count = 0
-        writer = None
 
         with open(output_path, "w", newline="", encoding=self.encoding) as f:
-            for record in records_iter:
-                data = record.to_dict()
-
-                # Initialize writer with fieldnames from first record
-                if writer is None:
-                    if fieldnames is None:
-                        fieldnames = list(data.keys())
-                    writer = csv.DictWriter(
-                        f,
-                        fieldnames=fieldnames,
-                        delimiter=self.delimiter,
-                        quoting=csv.QUOTE_NONNUMERIC,
-                    )
-                    writer.writeheader()
-
-                writer.writerow(data)
+            # os.linesep matches the line endings of the earlier pandas export
+            writer = csv.writer(
+                f,
+                delimiter=self.delimiter,
+                quoting=csv.QUOTE_NONNUMERIC,
+                lineterminator=os.linesep,
+            )
+
+            for row in rows:
+                # Header is written with the first record
+                if count == 0:
+                    writer.writerow(fieldnames)
+
+                writer.writerow(row)
                 count += 1
 
                 if count % 10000 == 0:
@@ -9,19 +9,17 @@ Exports occurrence records to Excel format with:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
-
-from gbif_downloader.api import OccurrenceRecord
+from gbif_downloader.api import EXPORT_COLUMNS, OccurrenceRecord
 from gbif_downloader.utils import get_logger
 
 # Try to import openpyxl for styling
 try:
     import openpyxl
     from openpyxl.styles import PatternFill, Font, Alignment
-    from openpyxl.utils.dataframe import dataframe_to_rows
 
     HAS_OPENPYXL = True
 except ImportError:
@@ -57,6 +55,15 @@ class ExcelExporter:
         color="FFFFFF", bold=True
     ) if HAS_OPENPYXL else None
 
+    HEADER_ALIGNMENT = Alignment(
+        horizontal="center"
+    ) if HAS_OPENPYXL else None
+
+    # Hyperlink style (shared by every link cell instead of built per cell)
+    LINK_FONT = Font(
+        color="0563C1", underline="single"
+    ) if HAS_OPENPYXL else None
+
     def __init__(self):
         """Initialize the exporter."""
         self.logger = get_logger()
@@ -86,24 +93,51 @@ class ExcelExporter:
 
         self.logger.info(f"Exporting {len(records):,} records to Excel...")
 
-        # Convert records to dictionaries
-        data = [record.to_dict() for record in records]
-        df = pd.DataFrame(data)
+        if not HAS_OPENPYXL:
+            raise ImportError("openpyxl is required for Excel export")
+
+        # Rows are built straight from the records; no DataFrame is needed
+        columns = list(EXPORT_COLUMNS) if records else []
+        rows = (record.to_row() for record in records)
 
-        if not HAS_OPENPYXL or not highlight_uncertain:
+        if not highlight_uncertain:
             # Simple export without styling
-            df.to_excel(output_path, index=False, engine="openpyxl")
+            self._export_plain(columns, rows, output_path)
             self.logger.info(f"Excel file saved: {output_path}")
             return output_path
 
         # Export with styling
-        self._export_with_styling(df, output_path, highlight_uncertain)
+        self._export_with_styling(columns, rows, output_path, highlight_uncertain)
 
         return output_path
 
+    def _export_plain(
+        self,
+        columns: list[str],
+        rows: Iterable[tuple[Any, ...]],
+        output_path: Path,
+    ) -> None:
+        """
+        Export without styling using a write-only workbook.
+
+        Args:
+            columns: Header names
+            rows: Row values, one tuple per record
+            output_path: Output file path
+        """
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("GBIF Data")
+
+        ws.append(columns)
+        for row in rows:
+            ws.append(row)
+
+        wb.save(output_path)
+
     def _export_with_styling(
         self,
-        df: pd.DataFrame,
+        columns: list[str],
+        rows: Iterable[tuple[Any, ...]],
         output_path: Path,
         highlight_uncertain: bool,
     ) -> None:
@@ -111,7 +145,8 @@ class ExcelExporter:
         Export with conditional formatting and styling.
 
         Args:
-            df: DataFrame to export
+            columns: Header names
+            rows: Row values, one tuple per record
             output_path: Output file path
             highlight_uncertain: Highlight rows with unknown uncertainty
         """
@@ -121,54 +156,46 @@ class ExcelExporter:
         ws.title = "GBIF Data"
 
         # Write header
-        for col_idx, column in enumerate(df.columns, start=1):
+        for col_idx, column in enumerate(columns, start=1):
             cell = ws.cell(row=1, column=col_idx, value=column)
             cell.fill = self.HEADER_FILL
             cell.font = self.HEADER_FONT
-            cell.alignment = Alignment(horizontal="center")
+            cell.alignment = self.HEADER_ALIGNMENT
 
         # Find uncertainty column index
         unc_col_idx = None
-        for idx, col in enumerate(df.columns):
+        for idx, col in enumerate(columns):
             if "uncertainty" in col.lower():
                 unc_col_idx = idx
                 break
 
+        # Column widths are sampled from the header and first 100 rows
+        max_lengths = [len(str(column)) for column in columns]
+
         # Write data rows
-        for row_idx, row in enumerate(df.itertuples(index=False), start=2):
-            is_uncertain = False
+        for row_idx, row in enumerate(rows, start=2):
+            ws.append(row)
 
             for col_idx, value in enumerate(row, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-
-                # Check if this is the uncertainty column
-                if col_idx - 1 == unc_col_idx:
-                    if pd.isna(value) or value is None or value == "":
-                        is_uncertain = True
-
                 # Make links clickable
                 if isinstance(value, str) and value.startswith("http"):
+                    cell = ws.cell(row=row_idx, column=col_idx)
                     cell.hyperlink = value
-                    cell.font = Font(color="0563C1", underline="single")
+                    cell.font = self.LINK_FONT
+
+                if row_idx <= 101 and value is not None:
+                    max_lengths[col_idx - 1] = max(
+                        max_lengths[col_idx - 1], len(str(value))
+                    )
 
             # Apply yellow highlight to entire row if uncertain
+            is_uncertain = unc_col_idx is not None and row[unc_col_idx] in (None, "")
             if highlight_uncertain and is_uncertain:
                 for col_idx in range(1, len(row) + 1):
                     ws.cell(row=row_idx, column=col_idx).fill = self.YELLOW_FILL
 
         # Auto-adjust column widths
-        for col_idx, column in enumerate(df.columns, start=1):
-            max_length = len(str(column))
-
-            # Sample first 100 rows for width calculation
-            for row in df.head(100).itertuples(index=False):
-                try:
-                    cell_value = row[col_idx - 1]
-                    if cell_value is not None:
-                        max_length = max(max_length, len(str(cell_value)))
-                except (IndexError, TypeError):
-                    pass
-
+        for col_idx, max_length in enumerate(max_lengths, start=1):
             # Set width with some padding, max 50 characters
             adjusted_width = min(max_length + 2, 50)
             ws.column_dimensions[
@@ -11,20 +11,32 @@ Exports occurrence records as GeoJSON FeatureCollection, suitable for:
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 from gbif_downloader.api import OccurrenceRecord
 from gbif_downloader.utils import get_logger
 
-# Try to import geojson library for validation
+# Try to import orjson for faster serialization
 try:
-    import geojson
-    from geojson import Feature, FeatureCollection, Point
+    import orjson
 
-    HAS_GEOJSON = True
+    HAS_ORJSON = True
 except ImportError:
-    HAS_GEOJSON = False
+    HAS_ORJSON = False
+
+# Features sit two levels deep in the collection (4 spaces at indent=2)
+FEATURE_INDENT = b"\n    "
+
+
+def _dumps_feature(feature: dict[str, Any]) -> bytes:
+    """Serialize one feature, indented as it appears inside the collection."""
+    if HAS_ORJSON:
+        data = orjson.dumps(feature, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(feature, indent=2, ensure_ascii=False).encode("utf-8")
+    return data.replace(b"\n", FEATURE_INDENT)
 
 
 class GeoJSONExporter:
@@ -54,15 +66,18 @@ class GeoJSONExporter:
 
     def export(
         self,
-        records: list[OccurrenceRecord],
+        records: Iterable[OccurrenceRecord],
         output_path: str | Path,
         **kwargs,  # Accept extra args for compatibility
     ) -> Path:
         """
         Export records to GeoJSON file.
 
+        Features are serialized and written one at a time, so neither the
+        full feature list nor the full document string is held in memory.
+
         Args:
-            records: List of OccurrenceRecord objects
+            records: Iterable of OccurrenceRecord objects
             output_path: Output file path
 
         Returns:
@@ -74,105 +89,52 @@ class GeoJSONExporter:
         if output_path.suffix.lower() not in (".geojson", ".json"):
             output_path = output_path.with_suffix(".geojson")
 
-        self.logger.info(f"Exporting {len(records):,} records to GeoJSON...")
+        self.logger.info("Exporting records to GeoJSON...")
 
-        if HAS_GEOJSON:
-            feature_collection = self._create_feature_collection_geojson(records)
-            geojson_str = geojson.dumps(feature_collection, indent=2)
-        else:
-            feature_collection = self._create_feature_collection_manual(records)
-            geojson_str = json.dumps(feature_collection, indent=2)
-
-        # Write to file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(geojson_str)
-
-        self.logger.info(f"GeoJSON file saved: {output_path}")
-        return output_path
-
-    def _create_feature_collection_geojson(
-        self, records: list[OccurrenceRecord]
-    ) -> "FeatureCollection":
-        """
-        Create FeatureCollection using geojson library.
-
-        Args:
-            records: List of OccurrenceRecord objects
-
-        Returns:
-            GeoJSON FeatureCollection
-        """
-        features = []
+        written = 0
         skipped = 0
 
-        for record in records:
-            # Skip records without coordinates
-            if record.latitude is None or record.longitude is None:
-                skipped += 1
-                continue
+        with open(output_path, "wb") as f:
+            f.write(b'{\n  "type": "FeatureCollection",\n  "features": [')
 
-            # Create point geometry
-            point = Point((record.longitude, record.latitude))
+            for record in records:
+                # Skip records without coordinates
+                if record.latitude is None or record.longitude is None:
+                    skipped += 1
+                    continue
 
-            # Create properties
-            properties = self._get_properties(record)
+                f.write(b",\n    " if written else FEATURE_INDENT)
+                f.write(_dumps_feature(self._create_feature(record)))
+                written += 1
 
-            # Create feature
-            feature = Feature(
-                geometry=point,
-                properties=properties,
-                id=str(record.key),
-            )
-            features.append(feature)
+            f.write(b"\n  ]\n}" if written else b"]\n}")
 
         if skipped > 0:
             self.logger.warning(
                 f"Skipped {skipped} records without coordinates"
             )
 
-        return FeatureCollection(features)
+        self.logger.info(f"GeoJSON file saved: {output_path} ({written:,} features)")
+        return output_path
 
-    def _create_feature_collection_manual(
-        self, records: list[OccurrenceRecord]
-    ) -> dict[str, Any]:
+    def _create_feature(self, record: OccurrenceRecord) -> dict[str, Any]:
         """
-        Create FeatureCollection manually (without geojson library).
+        Create a GeoJSON Feature for a record with coordinates.
 
         Args:
-            records: List of OccurrenceRecord objects
+            record: OccurrenceRecord
 
         Returns:
-            GeoJSON FeatureCollection as dictionary
+            GeoJSON Feature as dictionary
         """
-        features = []
-        skipped = 0
-
-        for record in records:
-            # Skip records without coordinates
-            if record.latitude is None or record.longitude is None:
-                skipped += 1
-                continue
-
-            # Create feature
-            feature = {
-                "type": "Feature",
-                "id": str(record.key),
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [record.longitude, record.latitude],
-                },
-                "properties": self._get_properties(record),
-            }
-            features.append(feature)
-
-        if skipped > 0:
-            self.logger.warning(
-                f"Skipped {skipped} records without coordinates"
-            )
-
         return {
-            "type": "FeatureCollection",
-            "features": features,
+            "type": "Feature",
+            "id": str(record.key),
+            "geometry": {
+                "type": "Point",
+                "coordinates": [record.longitude, record.latitude],
+            },
+            "properties": self._get_properties(record),
         }
 
     def _get_properties(self, record: OccurrenceRecord) -> dict[str, Any]:
@@ -203,10 +165,5 @@ class GeoJSONExporter:
 
     @staticmethod
     def is_available() -> bool:
-        """
-        Check if GeoJSON export is available.
-
-        Note: Even without the geojson library, we can still export
-        using manual JSON construction.
-        """
-        return True  # Always available, just with/without validation
+        """GeoJSON export is always available (stdlib json fallback)."""
+        return True
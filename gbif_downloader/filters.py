@@ -139,11 +139,14 @@ class FilterConfig:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class FilterResult:
     """
     Result of filtering a record.
 
+    Results are immutable; RecordFilter returns shared instances, one per
+    possible outcome, instead of allocating a new result per record.
+
     Attributes:
         keep: Whether to keep the record
         reason: Why the record was filtered (if not kept)
@@ -155,6 +158,32 @@ class FilterResult:
     uncertainty_status: str = "known"
 
 
+# Every possible outcome of RecordFilter.apply, built once
+_KEPT = {
+    status: FilterResult(keep=True, uncertainty_status=status)
+    for status in ("known", "unknown")
+}
+_REJECTED = {
+    reason: FilterResult(keep=False, reason=reason)
+    for reason in (
+        "duplicate",
+        "missing_year",
+        "year_too_old",
+        "year_too_new",
+        "missing_elevation",
+        "species_not_matched",
+        "country_not_matched",
+        "institution_not_matched",
+    )
+}
+_REJECTED["uncertainty_exceeded"] = FilterResult(
+    keep=False, reason="uncertainty_exceeded", uncertainty_status="exceeded"
+)
+_REJECTED["uncertainty_unknown"] = FilterResult(
+    keep=False, reason="uncertainty_unknown", uncertainty_status="unknown"
+)
+
+
 class RecordFilter:
     """
     Filter occurrence records based on configuration.
@@ -198,57 +227,49 @@ class RecordFilter:
         # 1. Deduplication check
         if self.config.deduplicate:
             if record.key in self._seen_keys:
-                return FilterResult(keep=False, reason="duplicate")
+                return _REJECTED["duplicate"]
             self._seen_keys.add(record.key)
 
         # 2. Year filter
         if self.config.require_year and record.year is None:
-            return FilterResult(keep=False, reason="missing_year")
+            return _REJECTED["missing_year"]
 
         if record.year is not None:
             if record.year < self.config.year_start:
-                return FilterResult(keep=False, reason="year_too_old")
+                return _REJECTED["year_too_old"]
             if self.config.year_end and record.year > self.config.year_end:
-                return FilterResult(keep=False, reason="year_too_new")
+                return _REJECTED["year_too_new"]
 
         # 3. Elevation filter
         if self.config.require_elevation and record.elevation is None:
-            return FilterResult(keep=False, reason="missing_elevation")
+            return _REJECTED["missing_elevation"]
 
         # 4. Coordinate uncertainty filter
         uncertainty_status = self._check_uncertainty(record)
         if uncertainty_status == "exceeded":
-            return FilterResult(
-                keep=False,
-                reason="uncertainty_exceeded",
-                uncertainty_status=uncertainty_status,
-            )
+            return _REJECTED["uncertainty_exceeded"]
         if uncertainty_status == "unknown" and not self.config.keep_unknown_uncertainty:
-            return FilterResult(
-                keep=False,
-                reason="uncertainty_unknown",
-                uncertainty_status=uncertainty_status,
-            )
+            return _REJECTED["uncertainty_unknown"]
 
         # 5. Species filter (if specified)
         if self._species_set:
             if not self._matches_species(record):
-                return FilterResult(keep=False, reason="species_not_matched")
+                return _REJECTED["species_not_matched"]
 
         # 6. Country filter (if specified)
         if self.config.countries:
             country = (record.country or "").upper()
             # Try to match country code from various fields
             if not any(c in country for c in self.config.countries):
-                return FilterResult(keep=False, reason="country_not_matched")
+                return _REJECTED["country_not_matched"]
 
         # 7. Institution filter (if specified)
         if self.config.institutions:
             inst = (record.institution_code or "").lower()
             if not any(i in inst for i in self.config.institutions):
-                return FilterResult(keep=False, reason="institution_not_matched")
+                return _REJECTED["institution_not_matched"]
 
-        return FilterResult(keep=True, uncertainty_status=uncertainty_status)
+        return _KEPT[uncertainty_status]
 
     def _check_uncertainty(self, record: OccurrenceRecord) -> str:
         """
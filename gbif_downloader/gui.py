@@ -7,8 +7,10 @@ GBIF occurrence data.
 
 from __future__ import annotations
 
+import queue
 import sys
 import threading
+from concurrent.futures import Future
 from pathlib import Path
 from tkinter import (
     Tk,
@@ -24,9 +26,22 @@ from tkinter import ttk
 from gbif_downloader import __version__
 from gbif_downloader.api import GBIFClient, TaxonNotFoundError, GBIFError
 from gbif_downloader.filters import FilterConfig, RecordFilter
-from gbif_downloader.exporters import get_exporter
+from gbif_downloader.exporters import get_exporter, get_extension
 from gbif_downloader.utils import setup_logging, get_logger
 
+# Refresh the progress widgets once per this many processed records
+PROGRESS_UPDATE_INTERVAL = 250
+
+# How often the main thread drains UI updates posted by the worker (ms)
+UI_POLL_INTERVAL_MS = 50
+
+# Save-dialog file type per output format
+SAVE_FILETYPES = {
+    "excel": ("Excel Files", "*.xlsx"),
+    "csv": ("CSV Files", "*.csv"),
+    "geojson": ("GeoJSON Files", "*.geojson"),
+}
+
 
 class ToolTipButton(ttk.Button):
     """A small help button that shows an info dialog."""
@@ -92,7 +107,14 @@ class GBIFDownloaderGUI:
         self.is_downloading = False
         self.stop_event = threading.Event()
 
+        # Tk is not thread-safe: the download thread posts callables here
+        # and the main loop runs them
+        self._ui_queue: queue.Queue = queue.Queue()
+
         self._create_widgets()
+        self._process_ui_queue()
+
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _create_widgets(self):
         """Create all GUI widgets."""
@@ -278,6 +300,38 @@ class GBIFDownloaderGUI:
         )
         ToolTipButton(parent, "Info", help_text).grid(row=row, column=2, padx=5)
 
+    def _post(self, func, *args):
+        """Schedule func(*args) to run on the Tk main thread."""
+        self._ui_queue.put((func, args))
+
+    def _call_in_ui(self, func, *args):
+        """Run func(*args) on the Tk main thread and wait for its result."""
+        future: Future = Future()
+
+        def run():
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+        self._post(run)
+        return future.result()
+
+    def _process_ui_queue(self):
+        """Run pending UI updates from the worker thread, then reschedule."""
+        try:
+            while True:
+                try:
+                    func, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    func(*args)
+                except Exception:
+                    self.logger.exception("Error while updating the UI")
+        finally:
+            self.root.after(UI_POLL_INTERVAL_MS, self._process_ui_queue)
+
     def _start_download(self):
         """Start the download process in a background thread."""
         if self.is_downloading:
@@ -302,6 +356,27 @@ class GBIFDownloaderGUI:
             )
             return
 
+        # Build filter config (Tk variables are only read on the main thread)
+        species = self.species_var.get().strip()
+        countries = self.countries_var.get().strip()
+
+        try:
+            config = FilterConfig(
+                genus=genus or None,
+                family=family or None,
+                species_list=species.split(",") if species else [],
+                year_start=year_start,
+                year_end=year_end,
+                uncertainty_max=uncertainty_max,
+                require_year=self.require_year_var.get(),
+                require_elevation=self.require_elev_var.get(),
+                keep_unknown_uncertainty=self.keep_unknown_unc_var.get(),
+                countries=countries.split(",") if countries else [],
+            )
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
         # Update UI state
         self.is_downloading = True
         self.stop_event.clear()
@@ -311,7 +386,10 @@ class GBIFDownloaderGUI:
         self.progress_var.set("Initializing...")
 
         # Start background thread
-        thread = threading.Thread(target=self._run_download)
+        thread = threading.Thread(
+            target=self._run_download,
+            args=(config, self.format_var.get()),
+        )
         thread.daemon = True
         thread.start()
 
@@ -321,30 +399,26 @@ class GBIFDownloaderGUI:
             self.stop_event.set()
             self.status_var.set("Stopping...")
 
-    def _run_download(self):
-        """Run the download process (called in background thread)."""
-        try:
-            # Build filter config
-            genus = self.genus_var.get().strip() or None
-            family = self.family_var.get().strip() or None
-            species = self.species_var.get().strip()
-            countries = self.countries_var.get().strip()
+    def _on_close(self):
+        """Stop any running download, then close the window."""
+        # The download's fetch workers are not daemon threads; unless told
+        # to stop they keep the process alive after the window is gone
+        self.stop_event.set()
+        self.root.destroy()
 
-            config = FilterConfig(
-                genus=genus,
-                family=family,
-                species_list=species.split(",") if species else [],
-                year_start=self.year_start_var.get(),
-                year_end=self.year_end_var.get(),
-                uncertainty_max=self.uncertainty_var.get(),
-                require_year=self.require_year_var.get(),
-                require_elevation=self.require_elev_var.get(),
-                keep_unknown_uncertainty=self.keep_unknown_unc_var.get(),
-                countries=countries.split(",") if countries else [],
-            )
+    def _run_download(self, config: FilterConfig, format_name: str):
+        """
+        Run the download process (called in background thread).
+
+        Widgets are never touched directly here; UI updates are posted
+        to the main thread with _post().
+        """
+        try:
+            genus = config.genus
+            family = config.family
 
             # Match taxon
-            self.status_var.set(f"Matching taxon '{genus or family}'...")
+            self._post(self.status_var.set, f"Matching taxon '{genus or family}'...")
             client = GBIFClient()
 
             try:
@@ -356,10 +430,12 @@ class GBIFDownloaderGUI:
                 return
 
             # Count records
-            self.status_var.set("Counting records...")
+            self._post(self.status_var.set, "Counting records...")
             total_count = client.count_occurrences(taxon.usage_key)
-            self.progress_bar["maximum"] = total_count
-            self.status_var.set(f"Found {total_count:,} records. Downloading...")
+            self._post(self.progress_bar.configure, {"maximum": total_count})
+            self._post(
+                self.status_var.set, f"Found {total_count:,} records. Downloading..."
+            )
 
             # Download and filter
             record_filter = RecordFilter(config)
@@ -381,37 +457,44 @@ class GBIFDownloaderGUI:
                 if result.keep:
                     filtered_records.append(record)
 
-                # Update progress
-                self.progress_bar["value"] = processed
-                if processed > total_count:
-                    self.progress_bar["maximum"] = processed
-                self.progress_var.set(
-                    f"Valid: {len(filtered_records):,} | Processed: {processed:,}"
-                )
-                self.root.update_idletasks()
+                # Update progress in batches; per-record Tk calls dominate
+                # the loop for large downloads
+                if processed % PROGRESS_UPDATE_INTERVAL == 0:
+                    self._post(
+                        self._update_progress,
+                        processed, len(filtered_records), total_count,
+                    )
 
+            self._post(
+                self._update_progress, processed, len(filtered_records), total_count
+            )
             client.close()
 
-            # Handle cancellation
+            # Handle cancellation (reported in the status line rather than a
+            # modal, so the user goes straight to the save dialog)
             if self.stop_event.is_set():
-                messagebox.showinfo(
-                    "Stopped",
-                    f"Download stopped.\nRecords collected: {len(filtered_records):,}"
+                self._post(
+                    self.status_var.set,
+                    f"Download stopped. Records collected: {len(filtered_records):,}",
                 )
                 if not filtered_records:
                     return
 
             # Handle no results
             if not filtered_records:
-                self.status_var.set("No valid records found.")
-                messagebox.showwarning(
+                self._post(self.status_var.set, "No valid records found.")
+                self._post(
+                    messagebox.showwarning,
                     "No Data",
-                    "No records passed the filter criteria."
+                    "No records passed the filter criteria.",
                 )
                 return
 
             # Save file
-            self._save_results(filtered_records, genus or family)
+            self._save_results(
+                filtered_records, genus or family, format_name,
+                config.keep_unknown_uncertainty,
+            )
 
         except GBIFError as e:
             self._show_error(f"GBIF API Error: {e}")
@@ -419,35 +502,37 @@ class GBIFDownloaderGUI:
             self.logger.exception("Unexpected error during download")
             self._show_error(f"Error: {e}")
         finally:
-            self.is_downloading = False
-            self.download_btn.config(state="normal")
-            self.stop_btn.config(state="disabled")
-
-    def _save_results(self, records: list, taxon_name: str):
-        """Prompt user to save results and export."""
-        self.status_var.set("Preparing file...")
-
-        format_name = self.format_var.get()
-        extensions = {
-            "excel": ("Excel Files", "*.xlsx"),
-            "csv": ("CSV Files", "*.csv"),
-            "geojson": ("GeoJSON Files", "*.geojson"),
-        }
-        ext = extensions[format_name]
-
-        default_name = f"{taxon_name}_GBIF.{ext[1].replace('*.', '')}"
-
-        path = filedialog.asksaveasfilename(
-            defaultextension=ext[1].replace("*", ""),
-            filetypes=[ext, ("All Files", "*.*")],
-            initialfile=default_name,
-            title="Save Results",
-        )
+            self._post(self._finish_download)
+
+    def _finish_download(self):
+        """Reset UI state after the download thread ends."""
+        self.is_downloading = False
+        self.download_btn.config(state="normal")
+        self.stop_btn.config(state="disabled")
+
+    def _update_progress(self, processed: int, valid: int, total_count: int):
+        """Refresh the progress bar and counters."""
+        self.progress_bar["value"] = processed
+        if processed > total_count:
+            self.progress_bar["maximum"] = processed
+        self.progress_var.set(f"Valid: {valid:,} | Processed: {processed:,}")
+
+    def _save_results(
+        self,
+        records: list,
+        taxon_name: str,
+        format_name: str,
+        highlight_uncertain: bool,
+    ):
+        """Prompt user to save results and export (called in background thread)."""
+        path = self._call_in_ui(self._ask_save_path, taxon_name, format_name)
 
         if not path:
-            self.status_var.set("Save cancelled.")
+            self._post(self.status_var.set, "Save cancelled.")
             return
 
+        self._post(self.status_var.set, "Preparing file...")
+
         # Export
         try:
             exporter_class = get_exporter(format_name)
@@ -455,23 +540,35 @@ class GBIFDownloaderGUI:
             output_path = exporter.export(
                 records,
                 path,
-                highlight_uncertain=self.keep_unknown_unc_var.get(),
+                highlight_uncertain=highlight_uncertain,
             )
 
-            self.status_var.set("Complete!")
-            messagebox.showinfo(
+            self._post(self.status_var.set, "Complete!")
+            self._post(
+                messagebox.showinfo,
                 "Success",
                 f"File saved successfully!\n\n"
                 f"Records: {len(records):,}\n"
-                f"File: {output_path}"
+                f"File: {output_path}",
             )
         except Exception as e:
             self._show_error(f"Error saving file: {e}")
 
+    def _ask_save_path(self, taxon_name: str, format_name: str) -> str:
+        """Show the save dialog and return the chosen path ("" if cancelled)."""
+        extension = get_extension(format_name)
+
+        return filedialog.asksaveasfilename(
+            defaultextension=extension,
+            filetypes=[SAVE_FILETYPES[format_name], ("All Files", "*.*")],
+            initialfile=f"{taxon_name}_GBIF{extension}",
+            title="Save Results",
+        )
+
     def _show_error(self, message: str):
-        """Show error message and reset UI state."""
-        self.status_var.set("Error")
-        self.root.after(0, lambda: messagebox.showerror("Error", message))
+        """Show error message (safe to call from the download thread)."""
+        self._post(self.status_var.set, "Error")
+        self._post(messagebox.showerror, "Error", message)
 
 
 def main():
@@ -1,5 +1,8 @@
 """Tests for the API module."""
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 from gbif_downloader.api import (
@@ -7,7 +10,9 @@ from gbif_downloader.api import (
     TaxonMatch,
     OccurrenceRecord,
     TaxonNotFoundError,
+    RateLimitError,
     APIError,
+    EXPORT_COLUMNS,
 )
 
 
@@ -84,6 +89,28 @@ class TestOccurrenceRecord:
         assert record.elevation == 1500
         assert record.genus == "Nebria"
 
+    def test_from_api_response_shares_repeated_strings(self):
+        """Test that low-cardinality fields are interned across records."""
+        # Build equal strings at runtime so they start out as distinct objects
+        first = OccurrenceRecord.from_api_response(
+            {"key": 1, "country": "".join(["Ita", "ly"]), "genus": "".join(["Neb", "ria"])}
+        )
+        second = OccurrenceRecord.from_api_response(
+            {"key": 2, "country": "".join(["It", "aly"]), "genus": "".join(["Nebr", "ia"])}
+        )
+
+        assert first.country is second.country
+        assert first.genus is second.genus
+        assert first.institution_code is None
+
+    def test_uses_slots(self):
+        """Test that records carry no per-instance __dict__."""
+        record = OccurrenceRecord.from_api_response({"key": 1, "year": 2020})
+
+        assert not hasattr(record, "__dict__")
+        record.year = None  # Fields stay assignable
+        assert record.year is None
+
     def test_gbif_url(self):
         """Test GBIF URL generation."""
         record = OccurrenceRecord(
@@ -118,6 +145,90 @@ class TestOccurrenceRecord:
         assert data["Genus"] == "Nebria"
         assert "Link" in data
 
+    def test_to_row_matches_to_dict(self):
+        """Test that to_row gives the to_dict values in column order."""
+        record = OccurrenceRecord.from_api_response(
+            {"key": 12345, "year": 2020, "genus": "Nebria", "country": "Italy"}
+        )
+
+        assert tuple(record.to_dict()) == EXPORT_COLUMNS
+        assert record.to_row() == tuple(record.to_dict().values())
+
+
+class FakeOccurrenceSearch:
+    """
+    Stand-in for GBIFClient._make_request serving occurrence search pages.
+
+    Args:
+        pages: Pages of results by year or (year, month); a page may be an
+            exception instance, which is raised when that page is requested
+        counts: Reported record counts by year, overriding the page totals
+        facet: "years" for a year facet built from pages, None for a
+            response without one, or an exception instance to raise
+        delays: Seconds to wait before answering, by year
+    """
+
+    def __init__(self, pages, counts=None, facet="years", delays=None):
+        self.pages = pages
+        self.counts = counts or {}
+        self.facet = facet
+        self.delays = delays or {}
+        self.calls = []
+        self.threads = set()
+
+    def _count(self, key):
+        if key in self.counts:
+            return self.counts[key]
+        pages = self.pages.get(key, [])
+        return sum(len(page) for page in pages if isinstance(page, list))
+
+    def __call__(self, endpoint, params, stop_check=None):
+        self.calls.append(params)
+        self.threads.add(threading.current_thread())
+        years = [key for key in self.pages if isinstance(key, int)]
+        total = sum(self._count(year) for year in years)
+
+        if params.get("facet") == "year":
+            if isinstance(self.facet, Exception):
+                raise self.facet
+            if self.facet is None:
+                return {"count": total}
+            counts = [{"name": str(year), "count": self._count(year)} for year in years]
+            return {"count": total, "facets": [{"field": "YEAR", "counts": counts}]}
+
+        if params.get("limit") == 0:
+            return {"count": total}
+
+        key = params["year"] if "month" not in params else (params["year"], params["month"])
+        time.sleep(self.delays.get(params["year"], 0))
+        pages = self.pages.get(key, [])
+        index = params["offset"] // params["limit"]
+        if index >= len(pages):
+            return {"count": self._count(key), "results": [], "endOfRecords": True}
+        if isinstance(pages[index], Exception):
+            raise pages[index]
+        return {
+            "count": self._count(key),
+            "results": pages[index],
+            "endOfRecords": index == len(pages) - 1,
+        }
+
+    def count_calls(self):
+        """Number of plain count queries (limit=0 without a facet)."""
+        return sum(
+            1 for params in self.calls
+            if params.get("limit") == 0 and "facet" not in params
+        )
+
+
+def download_keys(client, search, year_start, year_end, **kwargs):
+    """Run iter_occurrences_by_year against a fake search; return record keys."""
+    with patch.object(GBIFClient, "_make_request", side_effect=search):
+        records = client.iter_occurrences_by_year(
+            1035566, year_start=year_start, year_end=year_end, **kwargs
+        )
+        return [record.key for record in records]
+
 
 class TestGBIFClient:
     """Tests for GBIFClient class."""
@@ -157,6 +268,57 @@ class TestGBIFClient:
         assert taxon.canonical_name == "Nebria"
         assert taxon.rank == "GENUS"
 
+    @patch.object(GBIFClient, '_make_request')
+    def test_match_taxon_cached(self, mock_request, client):
+        """Test that repeated matches are served from the cache."""
+        mock_request.return_value = {
+            "usageKey": 1035566,
+            "scientificName": "Nebria Latreille, 1802",
+            "canonicalName": "Nebria",
+            "rank": "GENUS",
+            "status": "ACCEPTED",
+            "confidence": 97,
+            "matchType": "EXACT",
+        }
+
+        first = client.match_taxon("Nebria", rank="GENUS")
+        second = client.match_taxon("Nebria", rank="GENUS")
+
+        assert second is first
+        mock_request.assert_called_once()
+
+        # Validation still applies to cached matches
+        with pytest.raises(TaxonNotFoundError):
+            client.match_taxon("Nebria", rank="FAMILY")
+        mock_request.assert_called_once()
+
+    def test_cache_path_caches_only_taxon_matches(self, tmp_path):
+        """Test that the on-disk cache serves taxon matches but not occurrences."""
+        pytest.importorskip("requests_cache")
+        responses = pytest.importorskip("responses")
+        match_url = "https://api.gbif.org/v1/species/match"
+        search_url = "https://api.gbif.org/v1/occurrence/search"
+
+        with responses.RequestsMock() as rsps:
+            rsps.get(match_url, json={
+                "usageKey": 1035566,
+                "canonicalName": "Nebria",
+                "rank": "GENUS",
+                "matchType": "EXACT",
+            })
+            rsps.get(search_url, json={"count": 39355})
+
+            # A fresh client per run, sharing one cache file
+            for _ in range(2):
+                with GBIFClient(cache_path=tmp_path / "cache.sqlite") as client:
+                    client.match_taxon("Nebria", rank="GENUS")
+                    client.count_occurrences(1035566)
+
+            urls = [call.request.url.split("?")[0] for call in rsps.calls]
+
+        assert urls.count(match_url) == 1
+        assert urls.count(search_url) == 2
+
     @patch.object(GBIFClient, '_make_request')
     def test_match_taxon_not_found(self, mock_request, client):
         """Test taxon not found raises error."""
@@ -200,6 +362,129 @@ class TestGBIFClient:
         with pytest.raises(TaxonNotFoundError, match="may not be what you intended"):
             client.match_taxon("Nebra", rank="GENUS", strict=True)
 
+    def test_iter_by_year_counts_only_for_progress(self, client):
+        """Test that the count fallback only runs when progress is reported."""
+        # Without a year facet the total has to come from a count query
+        pages = {2020: [[{"key": 1}]]}
+
+        search = FakeOccurrenceSearch(pages, facet=APIError("HTTP error: 500"))
+        download_keys(client, search, 2020, 2020)
+        assert search.count_calls() == 0
+
+        search = FakeOccurrenceSearch(pages, facet=APIError("HTTP error: 500"))
+        download_keys(client, search, 2020, 2020, progress_callback=Mock())
+        assert search.count_calls() == 1
+
+    def test_iter_by_year_deduplicates_within_year(self):
+        """Test that records repeated across pages of a year are dropped."""
+        search = FakeOccurrenceSearch(
+            {2020: [[{"key": 1}, {"key": 2}], [{"key": 2}, {"key": 3}]]}
+        )
+
+        assert download_keys(GBIFClient(page_size=2), search, 2020, 2020) == [1, 2, 3]
+
+    def test_iter_by_year_keeps_partial_year_on_error(self):
+        """Test that records fetched before a failing page are still yielded."""
+        search = FakeOccurrenceSearch(
+            {2020: [[{"key": 1}, {"key": 2}], APIError("HTTP error: 500")]}
+        )
+
+        assert download_keys(GBIFClient(page_size=2), search, 2020, 2020) == [1, 2]
+
+    def test_iter_by_year_survives_rate_limit(self, client):
+        """Test that exhausted rate limit retries skip a year, not the download."""
+        limited = RateLimitError("GBIF rate limit exceeded. Please wait and retry.")
+        search = FakeOccurrenceSearch(
+            {2018: [[{"key": 2018}]], 2019: [limited], 2020: [[{"key": 2020}]]},
+            facet=limited,
+        )
+
+        assert download_keys(client, search, 2018, 2020) == [2018, 2020]
+
+    def test_iter_by_year_stop_ends_workers(self):
+        """Test that a stop from another thread ends the fetch workers promptly."""
+        client = GBIFClient(page_size=1)
+        search = FakeOccurrenceSearch(
+            {year: [[{"key": year * 1000 + i}] for i in range(200)] for year in range(2015, 2021)},
+            delays=dict.fromkeys(range(2015, 2021), 0.005),
+        )
+        stop = threading.Event()
+        consumer = threading.Thread(
+            target=download_keys,
+            args=(client, search, 2015, 2020),
+            kwargs={"stop_check": stop.is_set},
+        )
+
+        consumer.start()
+        time.sleep(0.1)
+        stop.set()
+        consumer.join(timeout=2)
+
+        assert not consumer.is_alive()
+        for worker in search.threads:
+            worker.join(timeout=1)
+            assert not worker.is_alive()
+
+    def test_iter_by_year_close_ends_workers(self):
+        """Test that closing the generator early ends the fetch workers promptly."""
+        client = GBIFClient(page_size=1)
+        search = FakeOccurrenceSearch(
+            {year: [[{"key": year * 1000 + i}] for i in range(200)] for year in range(2015, 2021)},
+        )
+
+        with patch.object(GBIFClient, "_make_request", side_effect=search):
+            records = client.iter_occurrences_by_year(1035566, year_start=2015, year_end=2020)
+            next(records)
+            records.close()
+
+        for worker in search.threads - {threading.current_thread()}:
+            worker.join(timeout=1)
+            assert not worker.is_alive()
+
+    def test_iter_by_year_only_fetches_populated_years(self, client):
+        """Test that years without records are skipped using the year facet."""
+        search = FakeOccurrenceSearch({1995: [[{"key": 1995}]], 1902: [[{"key": 1902}]]})
+
+        assert download_keys(client, search, 1900, 2000) == [1902, 1995]
+        # One facet query plus one page per populated year
+        assert len(search.calls) == 3
+
+    @patch("gbif_downloader.api.time.sleep")
+    def test_rate_limit_honors_retry_after(self, mock_sleep, client):
+        """Test that a 429 waits for Retry-After (plus jitter) and retries."""
+        limited = Mock(status_code=429, headers={"Retry-After": "5"})
+        ok = Mock(status_code=200, headers={}, content=b'{"count": 1}')
+        ok.json.return_value = {"count": 1}
+        client.session.get = Mock(side_effect=[limited, ok])
+
+        assert client.count_occurrences(1035566) == 1
+        delay = mock_sleep.call_args[0][0]
+        assert 5 <= delay <= 6
+
+    @patch("gbif_downloader.api.time.sleep")
+    def test_rate_limit_exhausted(self, mock_sleep, client):
+        """Test that RateLimitError is raised once retries run out."""
+        limited = Mock(status_code=429, headers={})
+        client.session.get = Mock(return_value=limited)
+
+        with pytest.raises(RateLimitError):
+            client.count_occurrences(1035566)
+        assert client.session.get.call_count == client.max_retries + 1
+
+    @patch("gbif_downloader.api.time.sleep")
+    def test_rate_limit_wait_interrupted_by_stop(self, mock_sleep, client):
+        """Test that a stop cuts a rate limit wait short."""
+        limited = Mock(status_code=429, headers={"Retry-After": "60"})
+        client.session.get = Mock(return_value=limited)
+        stop_requests = iter([False, True])
+
+        with pytest.raises(RateLimitError):
+            client._make_request(
+                "occurrence/search", {}, stop_check=lambda: next(stop_requests)
+            )
+        assert client.session.get.call_count == 1
+        assert mock_sleep.call_count == 1
+
     @patch.object(GBIFClient, '_make_request')
     def test_count_occurrences(self, mock_request, client):
         """Test counting occurrences."""
@@ -230,6 +515,26 @@ class TestGBIFClient:
         assert records[0].key == 1
         assert records[1].key == 2
 
+    def test_iter_by_year_splits_large_years_by_month(self, client, caplog):
+        """Test that years above the offset limit are fetched per month."""
+        pages = {(2020, month): [[{"key": month}]] for month in range(1, 13)}
+        pages[2020] = [[{"key": 0}]]
+        search = FakeOccurrenceSearch(pages, counts={2020: 150000})
+
+        assert download_keys(client, search, 2020, 2020) == list(range(1, 13))
+        # Records without a month are reported, not silently dropped
+        assert "149,988 of 150,000 records were not returned" in caplog.text
+
+    def test_iter_by_year_keeps_year_order(self, client):
+        """Test that concurrently fetched years are yielded in order."""
+        # Earlier years answer last
+        search = FakeOccurrenceSearch(
+            {year: [[{"key": year}]] for year in (2018, 2019, 2020)},
+            delays={2018: 0.03, 2019: 0.02, 2020: 0.01},
+        )
+
+        assert download_keys(client, search, 2018, 2020) == [2018, 2019, 2020]
+
     def test_context_manager(self, client):
         """Test using client as context manager."""
         with GBIFClient() as c:
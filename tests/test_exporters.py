@@ -0,0 +1,183 @@
+"""Tests for the exporters module."""
+
+import csv
+import json
+
+import pytest
+
+from gbif_downloader.api import EXPORT_COLUMNS, OccurrenceRecord
+from gbif_downloader.exporters import (
+    CSVExporter,
+    ExcelExporter,
+    GeoJSONExporter,
+    get_exporter,
+    get_extension,
+)
+
+
+@pytest.fixture
+def records():
+    """Records covering full data, missing values and missing coordinates."""
+    return [
+        OccurrenceRecord.from_api_response({
+            "key": 1001,
+            "year": 2020,
+            "eventDate": "2020-06-15",
+            "decimalLatitude": 46.5,
+            "decimalLongitude": 11.2,
+            "coordinateUncertaintyInMeters": 50.0,
+            "elevation": 1500,
+            "locality": "Schnalstal, Südtirol",
+            "genus": "Nebria",
+            "species": "Nebria germarii",
+            "scientificName": "Nebria germarii Heer, 1837",
+            "institutionCode": "MZUF",
+            "catalogNumber": "123",
+            "recordedBy": "Jürgen Müller",
+            "country": "Italy",
+            "stateProvince": "Trentino-Alto Adige",
+        }),
+        # Unknown uncertainty and sparse fields
+        OccurrenceRecord.from_api_response({
+            "key": 1002,
+            "year": 1998,
+            "decimalLatitude": 45.9,
+            "decimalLongitude": 7.8,
+            "genus": "Nebria",
+        }),
+        # No coordinates
+        OccurrenceRecord.from_api_response({"key": 1003, "year": 1975, "genus": "Nebria"}),
+    ]
+
+
+class TestGetExporter:
+    """Tests for exporter lookup."""
+
+    def test_formats(self):
+        """Test that format names resolve to exporters and extensions."""
+        assert get_exporter("excel") is ExcelExporter
+        assert get_exporter("CSV") is CSVExporter
+        assert get_exporter("json") is GeoJSONExporter
+        assert get_extension("xlsx") == ".xlsx"
+        assert get_extension("geojson") == ".geojson"
+
+    def test_unsupported_format(self):
+        """Test that unknown formats raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported format"):
+            get_exporter("parquet")
+
+
+class TestCSVExporter:
+    """Tests for CSVExporter."""
+
+    def test_export_round_trip(self, records, tmp_path):
+        """Test header, values, missing values and non-ASCII text."""
+        path = CSVExporter().export(records, tmp_path / "out.txt")
+
+        assert path.suffix == ".csv"
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == list(EXPORT_COLUMNS)
+        assert len(rows) == 4
+
+        first = dict(zip(EXPORT_COLUMNS, rows[1]))
+        assert first["Year"] == "2020"
+        assert first["Latitude"] == "46.5"
+        assert first["Locality"] == "Schnalstal, Südtirol"
+        assert first["Recorded By"] == "Jürgen Müller"
+        assert first["Link"] == "https://www.gbif.org/occurrence/1001"
+
+        second = dict(zip(EXPORT_COLUMNS, rows[2]))
+        assert second["Uncertainty (m)"] == ""
+        assert second["Locality"] == ""
+
+        third = dict(zip(EXPORT_COLUMNS, rows[3]))
+        assert third["Latitude"] == ""
+        assert third["Longitude"] == ""
+
+    def test_export_streaming_selected_columns(self, records, tmp_path):
+        """Test that fieldnames selects and orders columns."""
+        path = CSVExporter().export_streaming(
+            iter(records), tmp_path / "out.csv", fieldnames=["Link", "Year"]
+        )
+
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ["Link", "Year"]
+        assert rows[1] == ["https://www.gbif.org/occurrence/1001", "2020"]
+
+
+class TestGeoJSONExporter:
+    """Tests for GeoJSONExporter."""
+
+    def test_export_round_trip(self, records, tmp_path, caplog):
+        """Test that features load as JSON and records without coordinates are skipped."""
+        path = GeoJSONExporter().export(records, tmp_path / "out.txt")
+
+        assert path.suffix == ".geojson"
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        assert data["type"] == "FeatureCollection"
+        assert [feature["id"] for feature in data["features"]] == ["1001", "1002"]
+        assert "Skipped 1 records without coordinates" in caplog.text
+
+        feature = data["features"][0]
+        assert feature["geometry"] == {"type": "Point", "coordinates": [11.2, 46.5]}
+        assert feature["properties"]["Locality"] == "Schnalstal, Südtirol"
+        assert "Latitude" not in feature["properties"]
+        assert data["features"][1]["properties"]["Uncertainty (m)"] is None
+
+    def test_export_empty(self, tmp_path):
+        """Test that an export without features is still valid GeoJSON."""
+        path = GeoJSONExporter().export([], tmp_path / "out.geojson")
+
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == {"type": "FeatureCollection", "features": []}
+
+
+class TestExcelExporter:
+    """Tests for ExcelExporter."""
+
+    @pytest.fixture(autouse=True)
+    def openpyxl(self):
+        """Skip when openpyxl is not installed."""
+        return pytest.importorskip("openpyxl")
+
+    def test_export_with_styling(self, records, tmp_path, openpyxl):
+        """Test header, yellow fill for unknown uncertainty and hyperlinks."""
+        path = ExcelExporter().export(records, tmp_path / "out.xls")
+
+        assert path.suffix == ".xlsx"
+        ws = openpyxl.load_workbook(path)["GBIF Data"]
+        rows = list(ws.iter_rows(values_only=True))
+
+        assert rows[0] == EXPORT_COLUMNS
+        assert len(rows) == 4
+        assert rows[1][EXPORT_COLUMNS.index("Locality")] == "Schnalstal, Südtirol"
+        assert rows[2][EXPORT_COLUMNS.index("Uncertainty (m)")] is None
+        assert ws.freeze_panes == "A2"
+
+        # Row 3 (unknown uncertainty) is highlighted, row 2 is not
+        assert ws.cell(row=3, column=1).fill.fgColor.rgb.endswith("FFF2CC")
+        assert ws.cell(row=3, column=len(EXPORT_COLUMNS)).fill.fgColor.rgb.endswith("FFF2CC")
+        assert ws.cell(row=2, column=1).fill.fill_type is None
+
+        link = ws.cell(row=2, column=EXPORT_COLUMNS.index("Link") + 1)
+        assert link.hyperlink.target == "https://www.gbif.org/occurrence/1001"
+
+    def test_export_plain(self, records, tmp_path, openpyxl):
+        """Test that the unstyled export keeps values but adds no fill."""
+        path = ExcelExporter().export(
+            records, tmp_path / "out.xlsx", highlight_uncertain=False
+        )
+
+        ws = openpyxl.load_workbook(path)["GBIF Data"]
+        rows = list(ws.iter_rows(values_only=True))
+
+        assert rows[0] == EXPORT_COLUMNS
+        assert rows[1][EXPORT_COLUMNS.index("Recorded By")] == "Jürgen Müller"
+        assert rows[3][EXPORT_COLUMNS.index("Latitude")] is None
+        assert ws.cell(row=3, column=1).fill.fill_type is None
@@ -209,6 +209,17 @@ class TestRecordFilter:
         assert result2.keep is False
         assert result2.reason == "duplicate"
 
+    def test_results_are_shared(self, sample_record, default_filter):
+        """Test that identical outcomes reuse one immutable result."""
+        kept = default_filter.apply(sample_record)
+        assert kept is RecordFilter(FilterConfig(genus="Nebria")).apply(sample_record)
+
+        duplicate = default_filter.apply(sample_record)
+        assert duplicate is default_filter.apply(sample_record)
+
+        with pytest.raises(AttributeError):
+            kept.keep = False
+
     def test_deduplication_disabled(self, sample_record):
         """Test deduplication can be disabled."""
         filter_obj = RecordFilter(